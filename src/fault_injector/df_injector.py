@@ -4,6 +4,9 @@ dataframe fault injector
 """
 import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from numbers import Integral
+from fault_injector.fault_lib.base_fault import _NUMERIC_KINDS
 
 
 class DataFrameInjector:
@@ -14,12 +17,15 @@ class DataFrameInjector:
         injector_dict (dict):
         - keys correspond to column names in df
         - values correspond to fault instances
+        max_workers (int, optional): number of threads used to inject the columns concurrently. Defaults to None, which injects the columns one after another.
     """
 
-    def __init__(self, injector_dict:dict):
+    def __init__(self, injector_dict:dict, max_workers:int=None):
 
         self.injector_dict = injector_dict
+        self.max_workers = max_workers
         self._check_injector_dict()
+        self._check_max_workers()
 
 
     def inject_faults(self, df:pd.DataFrame):
@@ -35,11 +41,48 @@ class DataFrameInjector:
         df = df.copy()
         self._check_df_and_injector_dict(df)
 
-        for col, f in self.injector_dict.items():
-            df[col] = f.inject_fault(df[col].values)
+        groups = self._group_columns(df)
+        injectors = [f for f, _ in groups]
+        values = [df[cols[0]].to_numpy() if len(cols) == 1 else df[cols].to_numpy() for _, cols in groups]
+
+        # only the injection runs in threads, reading and writing df stays on this thread
+        if self.max_workers is None or self.max_workers == 1 or len(groups) < 2:
+            new_values = [f.inject_fault(x) for f, x in zip(injectors, values)]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(groups))) as executor:
+                new_values = list(executor.map(lambda f, x: f.inject_fault(x), injectors, values))
+
+        for (_, cols), x in zip(groups, new_values):
+            if len(cols) == 1:
+                df[cols[0]] = x
+            else:
+                df[cols] = x
         return df
 
 
+    def _group_columns(self, df):
+        """
+        Group the injector_dict columns so that columns sharing an injector instance and dtype are injected in one call
+
+        Only injectors wrapping a fault whose class declares _column_wise are grouped, since those faults act column-wise on 2-D arrays.
+        Any other injector, including one wrapping a subclass that does not redeclare _column_wise, gets a group of its own.
+
+        Args:
+            df (dataframe): variable provided in inject_faults
+
+        Returns:
+            list: (injector, list of column names) pairs
+        """
+        groups = {}
+        for col, f in self.injector_dict.items():
+            if vars(type(getattr(f, 'fault', None))).get('_column_wise', False):
+                key = (id(f), df[col].dtype)
+            else:
+                key = (id(f), col)
+            groups.setdefault(key, (f, []))[1].append(col)
+        return list(groups.values())
+
+
     def _check_injector_dict(self):
         """
         Check that the injector_dict is a dictionary and that the values are fault instances
@@ -54,6 +97,19 @@ class DataFrameInjector:
             self._check_fault_instance(f, col)
 
 
+    def _check_max_workers(self):
+        """
+        Check that max_workers is None or a positive int
+
+        Raises:
+            ValueError: max_workers needs to be a positive int value
+        """
+        if self.max_workers is None:
+            return
+        elif not isinstance(self.max_workers, Integral) or self.max_workers < 1:
+            raise ValueError(f"Invalid 'max_workers': \n must be None or a positive int.")
+
+
     def _check_df_and_injector_dict(self, df):
         """
         Check that:
@@ -66,6 +122,7 @@ class DataFrameInjector:
 
         Raises:
             TypeError: injector_dict key is not in df
+            ValueError: df column has an extension dtype
         """
         for key, fault in self.injector_dict.items():
             if not key in df.columns:
@@ -74,8 +131,12 @@ class DataFrameInjector:
             # check that the fault is an instance
             self._check_fault_instance(fault, key)
 
-            # check df[key].values
-            self._check_data_type(x=df[key].values, key=key)
+            # extension dtypes (e.g. nullable Int64/Float64, str) would lose their dtype and pd.NA through to_numpy()
+            if not isinstance(df[key].dtype, np.dtype):
+                raise ValueError(f"Invalid df['{key}']: \n must contain numeric values with a NumPy dtype, got '{df[key].dtype}'")
+
+            # check df[key].to_numpy()
+            self._check_data_type(x=df[key].to_numpy(), key=key)
 
     def _check_fault_instance(self, fault, col):
         """
@@ -105,6 +166,6 @@ class DataFrameInjector:
         """
 
         if not isinstance(x, np.ndarray):
-            raise ValueError(f"Invalid df['{key}'].values type: \n must be an np.ndarray")
-        elif not np.issubdtype(x.dtype, np.number):
+            raise ValueError(f"Invalid df['{key}'].to_numpy() type: \n must be an np.ndarray")
+        elif x.dtype.kind not in _NUMERIC_KINDS:
             raise ValueError(f"Invalid df['{key}']: \n must contain numeric values")
\ No newline at end of file
@@ -3,16 +3,38 @@
 base fault class
 """
 import numpy as np
-import matplotlib.pyplot as plt
 from numpy.typing import ArrayLike
 
 
+# dtype kinds accepted as numeric: signed int, unsigned int, float, complex
+_NUMERIC_KINDS = frozenset('iufc')
+
+
 class BaseFault:
     """
     BaseFault
     ---------
 
     """
+    # True for faults that act along axis 0, so a 2-D array is faulted one column at a time.
+    # Only read from the class that declares it, since a subclass may override __call__ for 1-D input.
+    _column_wise = False
+
+    # True for faults whose __call__ accepts materialize=False and then returns a read-only broadcast view.
+    # Also only read from the class that declares it.
+    _broadcast_view = False
+
+    # True for faults that treat each value independently, so batch can fault many windows in one call.
+    # Also only read from the class that declares it.
+    _elementwise = False
+
+    # True for faults that never modify their input in place, so Injector can pass them a view of the caller's data.
+    # Also only read from the class that declares it.
+    _preserves_input = False
+
+    # set when a param is assigned, so _check_params only runs on the next call after a change
+    _params_dirty = False
+
     def __init__(self):
 
         self.name = 'base_fault'
@@ -22,6 +44,84 @@ class BaseFault:
 
         return x
 
+    def batch(self, xs:list)->list:
+        """
+        Apply the fault to several windows
+
+        For faults declaring _elementwise, windows sharing a dtype are concatenated, faulted with a single call
+        and split back apart. Any other fault is called once per window.
+
+        Args:
+            xs (list): arrays containing numeric values, one per window
+
+        Returns:
+            list: np.ndarray of altered values for each window
+        """
+        xs = [self._check_data_type(x) for x in xs]
+        if not vars(type(self)).get('_elementwise', False):
+            return [self(x) for x in xs]
+
+        # concatenating mixed dtypes would promote every window to a common dtype
+        groups = {}
+        for i, x in enumerate(xs):
+            groups.setdefault(x.dtype, []).append(i)
+
+        out = [None] * len(xs)
+        for idx in groups.values():
+            values = self(np.concatenate([xs[i] for i in idx]))
+            for i, o in zip(idx, np.split(values, np.cumsum([len(xs[i]) for i in idx])[:-1])):
+                out[i] = o
+        return out
+
+
+    def _set_param(self, name:str, value):
+        """
+        Set a param attribute, deferring its validation with _check_params to the next call
+
+        Args:
+            name (str): attribute name the param is stored under
+            value: new param value
+        """
+        setattr(self, name, value)
+        self._params_dirty = True
+
+
+    def _set_params(self, values:dict):
+        """
+        Set several param attributes together and validate them with _check_params, restoring all previous values if any is invalid
+
+        Args:
+            values (dict): new param values keyed by the attribute name they are stored under
+
+        Raises:
+            ValueError: raised by _check_params when the new values are invalid
+            TypeError: raised by _check_params when a new value cannot be compared, e.g. a complex sigma
+        """
+        previous = {name: getattr(self, name) for name in values}
+        for name, value in values.items():
+            setattr(self, name, value)
+        try:
+            self._check_params()
+        except Exception:
+            for name, value in previous.items():
+                setattr(self, name, value)
+            raise
+        self._params_dirty = False
+
+
+    def _check_params_if_dirty(self):
+        """
+        Validate the params with _check_params if one was assigned since the last check
+
+        Raises:
+            ValueError: raised by _check_params when a param is invalid
+            TypeError: raised by _check_params when a param cannot be compared, e.g. a complex sigma
+        """
+        if self._params_dirty:
+            self._check_params()
+            self._params_dirty = False
+
+
     def _check_data_type(self, x:ArrayLike):
         """
         Check that x is an array containing numeric values
@@ -35,14 +135,16 @@ class BaseFault:
 
         """
 
-        if not isinstance(x, (list, tuple, np.ndarray)):
-            raise ValueError(
-                "Invalid 'x': must be array-like (list, tuple, np.ndarray)"
-            )
+        # ndarrays are the common case, so only lists and tuples need converting
+        if not isinstance(x, np.ndarray):
+            if not isinstance(x, (list, tuple)):
+                raise ValueError(
+                    "Invalid 'x': must be array-like (list, tuple, np.ndarray)"
+                )
 
-        x = np.asarray(x)
+            x = np.asarray(x)
 
-        if not np.issubdtype(x.dtype, np.number):
+        if x.dtype.kind not in _NUMERIC_KINDS:
             raise ValueError(f"Invalid 'x': \n must contain numeric values")
 
         return x
\ No newline at end of file
@@ -14,6 +14,9 @@ class DriftFault(BaseFault):
     Args:
         params (dict, optional): Dictionary containing the `drift_rate` key. `drift_rate` corresponds to the slope of the fault-induced offset. If None, defaults to `drift_rate` of 1.
     """
+    _column_wise = True
+    _preserves_input = True
+
     def __init__(self, params:dict = None):
         self.name = 'drift_fault'
 
@@ -21,9 +24,23 @@ class DriftFault(BaseFault):
             # set default values for params
             params = {'drift_rate': 1}
 
-        self.drift_rate = params.get('drift_rate')
+        self._drift_rate = params.get('drift_rate')
         self._check_params()
 
+        # (key, drift) pair reused while the input length and drift_rate stay the same
+        self._drift = None
+
+
+    @property
+    def drift_rate(self):
+        """Slope of the fault-induced offset"""
+        return self._drift_rate
+
+
+    @drift_rate.setter
+    def drift_rate(self, value):
+        self._set_param('_drift_rate', value)
+
 
     def __call__(self, x:ArrayLike)->np.ndarray:
         """The call method generates the drift fault
@@ -34,13 +51,38 @@ class DriftFault(BaseFault):
         Returns:
             np.ndarray: array containing the altered values
         """
-        self._check_params()
+        self._check_params_if_dirty()
         x = self._check_data_type(x)
 
-        drift = np.arange(start=1, stop=len(x)+1) * self.drift_rate
+        # drift along the first axis so 2-D inputs drift column-wise
+        drift = self._get_drift(len(x)).reshape((-1,) + (1,) * (x.ndim - 1))
         return x + drift
 
 
+    def _get_drift(self, length:int)->np.ndarray:
+        """
+        Get the drift added to a window, only rebuilding it when the length or drift_rate changes
+
+        Args:
+            length (int): number of values in the window
+
+        Returns:
+            np.ndarray: read-only array containing drift_rate * (1, 2, ..., length)
+        """
+        # the type is part of the key so that e.g. a rate of 1 and 1.0 keep their own result dtype
+        key = (length, type(self.drift_rate), self.drift_rate)
+
+        # read self._drift once so a fault shared between threads never returns another call's drift
+        cached = self._drift
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        drift = np.arange(start=1, stop=length+1) * self.drift_rate
+        drift.flags.writeable = False
+        self._drift = (key, drift)
+        return drift
+
+
     def _check_params(self):
         """
         Checks the params
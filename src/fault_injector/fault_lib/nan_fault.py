@@ -11,20 +11,34 @@ class NaNFault(BaseFault):
     """
     Simulate a **NaN fault**: models a sensor failure where readings are completely missing for a continuous period of time
     """
+    _column_wise = True
+    _preserves_input = True
+    _broadcast_view = True
+    _elementwise = True
+
     def __init__(self):
         self.name = 'nan_fault'
 
 
-    def __call__(self, x:ArrayLike)->np.ndarray:
+    def __call__(self, x:ArrayLike, materialize:bool=True)->np.ndarray:
         """The call method generates the NaN fault
 
         Args:
             x (np.array): array containing numeric values that represent the original value
+            materialize (bool, optional): when False, return a read-only broadcast view of a single NaN instead of allocating a new array. Defaults to True.
 
         Returns:
             np.ndarray: array containing the NaN values
         """
         x = self._check_data_type(x)
 
-        return np.full(len(x), np.nan)
+        # float inputs keep their precision, anything else needs float64 to hold NaN
+        dtype = x.dtype if x.dtype.kind == 'f' else np.float64
+
+        if not materialize:
+            return np.broadcast_to(np.array(np.nan, dtype=dtype), x.shape)
+
+        fault_values = np.empty(x.shape, dtype=dtype)
+        fault_values.fill(np.nan)
+        return fault_values
 
@@ -15,8 +15,13 @@ class NormalNoiseFault(BaseFault):
         params (dict, optional):
             - mu (numeric): Mean of the Gaussian noise distribution
             - sigma (numeric): Standard deviation of the Gaussian noise distribution. Must be non-negative.
+        seed (int | np.random.Generator, optional): seed or generator used to draw the noise. Defaults to None, which seeds from fresh OS entropy.
     """
-    def __init__(self, params:dict = None):
+    _column_wise = True
+    _preserves_input = True
+    _elementwise = True
+
+    def __init__(self, params:dict = None, seed=None):
         self.name = 'normal_noise_fault'
 
         if params is None:
@@ -24,10 +29,34 @@ class NormalNoiseFault(BaseFault):
             params = {'mu': 0,
                       'sigma': 1}
 
-        self.mu = params.get('mu')
-        self.sigma = params.get('sigma')
+        self._mu = params.get('mu')
+        self._sigma = params.get('sigma')
         self._check_params()
 
+        self._rng = np.random.default_rng(seed)
+
+
+    @property
+    def mu(self):
+        """Mean of the Gaussian noise distribution"""
+        return self._mu
+
+
+    @mu.setter
+    def mu(self, value):
+        self._set_param('_mu', value)
+
+
+    @property
+    def sigma(self):
+        """Standard deviation of the Gaussian noise distribution"""
+        return self._sigma
+
+
+    @sigma.setter
+    def sigma(self, value):
+        self._set_param('_sigma', value)
+
 
     def __call__(self, x:ArrayLike)->np.ndarray:
         """The call method generates the normal noise fault
@@ -38,11 +67,25 @@ class NormalNoiseFault(BaseFault):
         Returns:
             np.ndarray: array containing the altered values
         """
-        self._check_params()
+        self._check_params_if_dirty()
         x = self._check_data_type(x)
 
-        noise =  np.random.normal(self.mu, self.sigma, len(x))
-        return x + noise
+        # match float32 signals so the noise does not upcast them to float64
+        dtype = np.float32 if x.dtype == np.float32 else np.float64
+
+        # cast the params to the noise dtype too, so numpy float64 scalars do not upcast float32 signals
+        sigma = dtype(self.sigma)
+        mu = self.mu if np.iscomplexobj(self.mu) else dtype(self.mu)
+
+        noise = self._rng.standard_normal(x.shape, dtype=dtype)
+        noise *= sigma
+
+        # noise is a fresh array, so build the result in it unless mu or x need a wider dtype
+        if np.result_type(x, noise, mu) != noise.dtype:
+            return x + noise + mu
+        noise += mu
+        noise += x
+        return noise
 
 
     def _check_params(self):
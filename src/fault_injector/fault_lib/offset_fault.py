@@ -14,6 +14,10 @@ class OffsetFault(BaseFault):
     Args:
         params (dict, optional): dictionary expecting the `offset_by` key. This is the value that is constantly added to the true values. If set to None, `offset_by` defaults to 1.
     """
+    _column_wise = True
+    _preserves_input = True
+    _elementwise = True
+
     def __init__(self, params:dict = None):
         self.name = 'offset_fault'
 
@@ -21,23 +25,42 @@ class OffsetFault(BaseFault):
             # set default values for params
             params = {'offset_by': 1}
 
-        self.offset_by = params.get('offset_by')
+        self._offset_by = params.get('offset_by')
         self._check_params()
 
 
-    def __call__(self, x:ArrayLike)->np.ndarray:
+    @property
+    def offset_by(self):
+        """Value that is constantly added to the true values"""
+        return self._offset_by
+
+
+    @offset_by.setter
+    def offset_by(self, value):
+        self._set_param('_offset_by', value)
+
+
+    def __call__(self, x:ArrayLike, inplace:bool=False)->np.ndarray:
         """The call method generates the offset fault
 
         Args:
             x (ArrayLike): array containing numeric values that represent the original value
+            inplace (bool, optional): when True and x is an np.ndarray that can hold the result without changing dtype, the offset is added directly into x. Defaults to False.
 
         Returns:
             np.ndarray: array containing the altered values
         """
-        self._check_params()
+        self._check_params_if_dirty()
         x = self._check_data_type(x)
 
-        return x + self.offset_by
+        # keep float signals at their own precision rather than upcasting to the offset's
+        offset_by = self.offset_by
+        if x.dtype.kind == 'f' and not np.iscomplexobj(offset_by):
+            offset_by = x.dtype.type(offset_by)
+
+        if inplace and np.result_type(x, offset_by) == x.dtype:
+            return np.add(x, offset_by, out=x)
+        return x + offset_by
 
 
     def _check_params(self):
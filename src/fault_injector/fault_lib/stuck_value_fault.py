@@ -15,6 +15,11 @@ class StuckValueFault(BaseFault):
     Args:
         params (dict, optional): dictionary containing the `stuck_val` key, which corresponds to the repeated value in the output. If set to None, defaults to a `stuck_val` of 1.
     """
+    _column_wise = True
+    _preserves_input = True
+    _broadcast_view = True
+    _elementwise = True
+
     def __init__(self, params:dict = None):
         self.name = 'stuck_value_fault'
 
@@ -22,23 +27,40 @@ class StuckValueFault(BaseFault):
             # set default values for params
             params = {'stuck_val': 1}
 
-        self.stuck_val = params.get('stuck_val')
+        self._stuck_val = params.get('stuck_val')
         self._check_params()
 
 
-    def __call__(self, x:ArrayLike)->np.ndarray:
+    @property
+    def stuck_val(self):
+        """Value repeated in the output"""
+        return self._stuck_val
+
+
+    @stuck_val.setter
+    def stuck_val(self, value):
+        self._set_param('_stuck_val', value)
+
+
+    def __call__(self, x:ArrayLike, materialize:bool=True)->np.ndarray:
         """The call method generates the stuck value fault
 
         Args:
             x (ArrayLike): array containing numeric values that represent the original value
+            materialize (bool, optional): when False, return a read-only broadcast view of stuck_val instead of allocating a new array. Defaults to True.
 
         Returns:
             np.ndarray: array containing the altered values
         """
-        self._check_params()
+        self._check_params_if_dirty()
         x = self._check_data_type(x)
 
-        return np.full(len(x), self.stuck_val)
+        if not materialize:
+            return np.broadcast_to(np.asarray(self.stuck_val), x.shape)
+
+        fault_values = np.empty(x.shape, dtype=np.asarray(self.stuck_val).dtype)
+        fault_values.fill(self.stuck_val)
+        return fault_values
 
 
     def _check_params(self):
@@ -16,8 +16,13 @@ class UniformNoiseFault(BaseFault):
         params (dict):
             - min_val (numeric): Mean of the Gaussian noise distribution.
             - max_val (numeric): Standard deviation of the Gaussian noise distribution. Must be non-negative.
+        seed (int | np.random.Generator, optional): seed or generator used to draw the noise. Defaults to None, which seeds from fresh OS entropy.
     """
-    def __init__(self, params:dict = None):
+    _column_wise = True
+    _preserves_input = True
+    _elementwise = True
+
+    def __init__(self, params:dict = None, seed=None):
         self.name = 'uniform_noise_fault'
 
         if params is None:
@@ -25,10 +30,48 @@ class UniformNoiseFault(BaseFault):
             params = {'min_val': 0,
                       'max_val': 1}
 
-        self.min_val = params.get('min_val')
-        self.max_val = params.get('max_val')
+        self._min_val = params.get('min_val')
+        self._max_val = params.get('max_val')
         self._check_params()
 
+        self._rng = np.random.default_rng(seed)
+
+
+    @property
+    def min_val(self):
+        """Lower bound of the uniform noise distribution"""
+        return self._min_val
+
+
+    @min_val.setter
+    def min_val(self, value):
+        self._set_param('_min_val', value)
+
+
+    @property
+    def max_val(self):
+        """Upper bound of the uniform noise distribution"""
+        return self._max_val
+
+
+    @max_val.setter
+    def max_val(self, value):
+        self._set_param('_max_val', value)
+
+
+    def set_range(self, min_val, max_val):
+        """
+        Set both bounds at once and validate them immediately, rather than on the next call
+
+        Args:
+            min_val (numeric): new lower bound of the uniform noise distribution
+            max_val (numeric): new upper bound of the uniform noise distribution. Must be greater than min_val.
+
+        Raises:
+            ValueError: the new bounds are invalid, the previous bounds are kept
+        """
+        self._set_params({'_min_val': min_val, '_max_val': max_val})
+
 
     def __call__(self, x:ArrayLike)->np.ndarray:
         """The call method generates the uniform noise fault
@@ -39,11 +82,25 @@ class UniformNoiseFault(BaseFault):
         Returns:
             np.ndarray: array containing the altered values
         """
-        self._check_params()
+        self._check_params_if_dirty()
         x = self._check_data_type(x)
 
-        noise =  np.random.uniform(self.min_val, self.max_val, len(x))
-        return x + noise
+        # match float32 signals so the noise does not upcast them to float64
+        dtype = np.float32 if x.dtype == np.float32 else np.float64
+
+        # cast the params to the noise dtype too, so numpy float64 scalars do not upcast float32 signals
+        min_val = dtype(self.min_val)
+        span = dtype(self.max_val - self.min_val)
+
+        noise = self._rng.random(x.shape, dtype=dtype)
+        noise *= span
+
+        # noise is a fresh array, so build the result in it unless x needs a wider dtype
+        if np.result_type(x, noise, min_val) != noise.dtype:
+            return x + noise + min_val
+        noise += min_val
+        noise += x
+        return noise
 
 
     def _check_params(self):
@@ -3,8 +3,9 @@
 fault injector class
 """
 import numpy as np
-from numbers import Number
+from numbers import Integral, Number
 from numpy.typing import ArrayLike
+from fault_injector.fault_lib.base_fault import _NUMERIC_KINDS
 
 
 class Injector:
@@ -37,24 +38,79 @@ class Injector:
         self.stop = params.get('stop')
         self._initial_check_params()
 
+        # (len(x), start, stop) and their types last validated by _check_params
+        self._checked = None
 
-    def inject_fault(self, x:ArrayLike) -> np.ndarray:
+
+    def inject_fault(self, x:ArrayLike, inplace:bool=False) -> np.ndarray:
         """
         Inject the fault into the data
 
+        The fault is called on a copy of x[start:stop], and its return value is written back into that window.
+        The copy is skipped when inplace, or when the fault's class declares _preserves_input.
+
         Args:
             x (ArrayLike): the original values that will get the fault injected into it
+            inplace (bool, optional): when True and x is an np.ndarray, the fault is written directly into x instead of into a copy. Defaults to False.
 
         Returns:
             np.ndarray: the updated values after the fault is injected into it
         """
         x = self._check_data_type(x)
-        self._check_params(x)
+        out = x if inplace else np.empty_like(x)
+        return self._inject(out, x)
 
-        x = x.copy()
-        f = self.fault(x[self.start:self.stop])
-        x[self.start:self.stop] = f
-        return x
+
+    def inject_fault_into(self, out:np.ndarray, x:ArrayLike) -> np.ndarray:
+        """
+        Inject the fault into the data, writing the result into a caller-supplied buffer
+
+        Reusing the same out across calls avoids allocating a new array for every injection.
+
+        Args:
+            out (np.ndarray): array with the same shape and dtype as x that receives the updated values
+            x (ArrayLike): the original values that will get the fault injected into it
+
+        Raises:
+            ValueError: 'out' must be an np.ndarray with the same shape and dtype as x
+
+        Returns:
+            np.ndarray: out, holding the updated values after the fault is injected into it
+        """
+        x = self._check_data_type(x)
+        if not isinstance(out, np.ndarray) or out.shape != x.shape or out.dtype != x.dtype:
+            raise ValueError(f"Invalid 'out': \n must be an np.ndarray with the same shape and dtype as x {x.shape}, {x.dtype}")
+
+        return self._inject(out, x)
+
+
+    def inject_fault_batch(self, X:ArrayLike) -> np.ndarray:
+        """
+        Inject the fault into a batch of signals
+
+        Faults whose class declares _column_wise act column-wise on 2-D arrays, so they are applied to X.T with a single fault call.
+        Any other fault is injected into one row at a time.
+
+        Args:
+            X (ArrayLike): 2-D array containing one signal per row
+
+        Raises:
+            ValueError: X must be a 2-D array
+
+        Returns:
+            np.ndarray: the updated signals after the fault is injected into each row
+        """
+        X = self._check_data_type(X)
+        if X.ndim != 2:
+            raise ValueError(f"Invalid 'X': \n must be a 2-D array with one signal per row, got {X.ndim} dimension(s)")
+
+        if vars(type(self.fault)).get('_column_wise', False):
+            return self.inject_fault(X.T).T
+
+        out = np.empty_like(X)
+        for row_out, row in zip(out, X):
+            self.inject_fault_into(row_out, row)
+        return out
 
 
     def check_fault_instance(self, fault):
@@ -77,6 +133,8 @@ class Injector:
         - start: must be an int value
         - stop: must be an int value
 
+        Valid values are stored as plain ints, so numpy integer params do not slow down index arithmetic.
+
         Raises:
             ValueError: param is None
             ValueError: param needs to be an int value
@@ -84,14 +142,17 @@ class Injector:
         # start checks
         if self.start is None:
             raise ValueError(f"Invalid 'start': \n self.start is set to none")
-        elif not isinstance(self.start, (int, np.int64, np.int32)):
-            raise ValueError(f"Invalid 'start': \n must be an int type (int, np.int64, np.int32).")
+        elif not isinstance(self.start, Integral):
+            raise ValueError(f"Invalid 'start': \n must be an int type (int, np.integer).")
 
         # stop checks
         if self.stop is None:
             raise ValueError(f"Invalid 'stop': \n self.stop is set to none")
-        elif not isinstance(self.stop, (int, np.int64, np.int32)):
-            raise ValueError(f"Invalid 'stop': \n must be an int type (int, np.int64, np.int32).")
+        elif not isinstance(self.stop, Integral):
+            raise ValueError(f"Invalid 'stop': \n must be an int type (int, np.integer).")
+
+        self.start = int(self.start)
+        self.stop = int(self.stop)
 
 
     def _check_data_type(self, x:ArrayLike):
@@ -114,12 +175,58 @@ class Injector:
 
         x = np.asarray(x)
 
-        if not np.issubdtype(x.dtype, np.number):
+        if x.dtype.kind not in _NUMERIC_KINDS:
             raise ValueError(f"Invalid 'x': \n must contain numeric values")
 
         return x
 
 
+    def _inject(self, out:np.ndarray, x:np.ndarray) -> np.ndarray:
+        """
+        Write x with the fault injected into x[start:stop] into out
+
+        Args:
+            out (np.ndarray): array with the same shape and dtype as x, or x itself to inject in place
+            x (np.ndarray): the original values that will get the fault injected into it
+
+        Returns:
+            np.ndarray: out, which is left equal to x when the window start:stop is empty
+        """
+        # only re-check start/stop when they or the length of x change, the types are
+        # part of the key since e.g. 1.0 == 1 but 1.0 is not a valid index
+        checked = (len(x), type(self.start), self.start, type(self.stop), self.stop)
+        if checked != self._checked:
+            self._check_params(x)
+            # _check_params stores start/stop as plain ints
+            self._checked = (len(x), int, self.start, int, self.stop)
+
+        start, stop, _ = slice(self.start, self.stop).indices(len(x))
+
+        # an empty window leaves x unchanged, so the fault is not called
+        if stop <= start:
+            if out is not x:
+                np.copyto(out, x)
+            return out
+
+        window = x[start:stop]
+        if out is not x:
+            # only copy the values outside the fault window, the window is overwritten below
+            np.copyto(out[:start], x[:start])
+            np.copyto(out[stop:], x[stop:])
+
+            # a fault that may modify its input in place is called on a copy of the window, so x is left unchanged
+            if not vars(type(self.fault)).get('_preserves_input', False):
+                window = out[start:stop]
+                np.copyto(window, x[start:stop])
+
+        if vars(type(self.fault)).get('_broadcast_view', False):
+            # the values are copied into out, so a broadcast view saves allocating them
+            out[start:stop] = self.fault(window, materialize=False)
+        else:
+            out[start:stop] = self.fault(window)
+        return out
+
+
     def _check_params(self, x):
         """
         Checks the params
@@ -133,14 +240,10 @@ class Injector:
         x_len = len(x)
 
         # start checks
-        if self.start >= x_len:
-            raise ValueError(f"Invalid 'start': \n the current start value is outside the x index values \n current start={self.start}, length of x={x_len}")
-        elif self.start < -x_len:
+        if not -x_len <= self.start < x_len:
             raise ValueError(f"Invalid 'start': \n the current start value is outside the x index values \n current start={self.start}, length of x={x_len}")
 
         # stop checks
-        if self.stop > x_len:
-            raise ValueError(f"Invalid 'stop': \n the current stop value is outside the x index values \n current stop={self.stop}, length of x={x_len}")
-        elif self.stop <= -x_len:
+        if not -x_len < self.stop <= x_len:
             raise ValueError(f"Invalid 'stop': \n the current stop value is outside the x index values \n current stop={self.stop}, length of x={x_len}")
 
@@ -2,9 +2,9 @@
 """
 plotting class
 """
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from fault_injector.fault_lib.base_fault import _NUMERIC_KINDS
 
 
 class FaultVisualizer:
@@ -49,6 +49,9 @@ class FaultVisualizer:
             title (str, optional): used as the title in the plot. Defaults to None.
             file_name (str, optional): file name when saving the figure. When not equal to None, the plot will be saved. Defaults to None.
         """
+        # imported here so that importing fault_injector does not load pyplot
+        import matplotlib.pyplot as plt
+
         self._check_data_type(x=original_values, key='original_values')
         self._check_data_type(x=new_values, key='new_values')
 
@@ -111,6 +114,9 @@ class FaultVisualizer:
             title (str, optional): _description_. Defaults to None.
             file_name (str, optional): _description_. Defaults to None.
         """
+        # imported here so that importing fault_injector does not load pyplot
+        import matplotlib.pyplot as plt
+
         self._check_data_type(x=original_values, key='original_values')
         self._check_data_type(x=new_values, key='new_values')
 
@@ -125,9 +131,9 @@ class FaultVisualizer:
         # axis labels
         ax.set(xlabel="time", ylabel="value")
 
-        # dynamic y-limit
-        ymin = min(min(original_values), min(new_values)) * 0.995
-        ymax = max(max(original_values), max(new_values)) * 1.005
+        # dynamic y-limit, ignoring NaN values (e.g. from a NaN fault)
+        ymin = np.nanmin([np.nanmin(original_values), np.nanmin(new_values)]) * 0.995
+        ymax = np.nanmax([np.nanmax(original_values), np.nanmax(new_values)]) * 1.005
         ax.set_ylim([ymin, ymax])
 
         # set title
@@ -183,7 +189,7 @@ class FaultVisualizer:
 
         if not isinstance(x, np.ndarray):
             raise ValueError(f"Invalid {key}: \n must be an np.ndarray")
-        elif not np.issubdtype(x.dtype, np.number):
+        elif x.dtype.kind not in _NUMERIC_KINDS:
             raise ValueError(f"Invalid {key}: \n must contain numeric values")
 
 
@@ -1,6 +1,19 @@
 import numpy as np
 import pytest
 from fault_injector.fault_lib.base_fault import BaseFault
+from fault_injector.fault_lib.offset_fault import OffsetFault
+
+
+class RampFault(BaseFault):
+    """BaseFault subclass whose output depends on the position in the window"""
+    def __call__(self, x):
+        return x + np.arange(len(x))
+
+
+class RampOffsetFault(OffsetFault):
+    """OffsetFault subclass overriding __call__ without redeclaring _elementwise"""
+    def __call__(self, x):
+        return x + np.arange(len(x))
 
 
 # Constructor tests
@@ -45,6 +58,13 @@ def test_check_data_type_non_numeric_array_raises():
         f._check_data_type(x)
 
 
+def test_check_data_type_bool_array_raises():
+    f = BaseFault()
+    x = np.array([True, False])
+    with pytest.raises(ValueError, match="numeric values"):
+        f._check_data_type(x)
+
+
 @pytest.mark.parametrize("valid_value", [
     [1, 2, 3],
     (1.0, 2.0, 3.0),
@@ -65,3 +85,30 @@ def test_check_data_type_returns_numpy_array():
     out = f._check_data_type(x)
     assert isinstance(out, np.ndarray)
     np.testing.assert_array_equal(out, np.array(x))
+
+
+# batch tests
+@pytest.mark.parametrize("xs", [
+    [np.array([1, 2, 3]), [4, 5], np.array([], dtype=int)],
+    [np.array([1.5, 2.5], dtype=np.float32), np.array([1, 2, 3]), np.array([4.0]), np.array([6, 7], dtype=np.float32)],
+])
+def test_batch_matches_per_window_calls(xs):
+    f = OffsetFault(params={'offset_by': 2})
+    out = f.batch(xs)
+    assert len(out) == len(xs)
+    for o, x in zip(out, xs):
+        expected = f(x)
+        assert o.dtype == expected.dtype
+        np.testing.assert_array_equal(o, expected)
+
+
+@pytest.mark.parametrize("f", [RampFault(), RampOffsetFault()])
+def test_batch_calls_non_elementwise_faults_per_window(f):
+    out = f.batch([np.zeros(3), np.zeros(3)])
+    for o in out:
+        np.testing.assert_array_equal(o, [0, 1, 2])
+
+
+def test_batch_empty_list():
+    f = BaseFault()
+    assert f.batch([]) == []
@@ -2,6 +2,9 @@ import numpy as np
 import pandas as pd
 import pytest
 from fault_injector.df_injector import DataFrameInjector
+from fault_injector.fault_lib import DriftFault
+from fault_injector.fault_lib.base_fault import BaseFault
+from fault_injector.injector import Injector
 
 # Helper / mock fault classes
 class DummyFault:
@@ -21,6 +24,18 @@ class BadFaultClass:
     def inject_fault(self, x):
         return x
 
+
+class RampFault(BaseFault):
+    """BaseFault subclass written for 1-D input"""
+    def __call__(self, x):
+        return x + np.arange(len(x))
+
+
+class RampDriftFault(DriftFault):
+    """DriftFault subclass overriding __call__ for 1-D input"""
+    def __call__(self, x):
+        return x + np.arange(len(x))
+
 # Constructor tests
 def test_valid_injector_dict():
     inj = DataFrameInjector(
@@ -82,6 +97,57 @@ def test_original_dataframe_not_modified():
 
     assert np.array_equal(df["A"].values, [1, 2, 3])
 
+def test_shared_injector_matches_per_column_injection():
+    df = pd.DataFrame({
+        "A": [1.0, 2.0, 3.0, 4.0],
+        "B": [10.0, 20.0, 30.0, 40.0],
+        "C": [5, 6, 7, 8],
+    })
+    shared = Injector(fault=DriftFault(params={'drift_rate': 2}), params={'start': 1, 'stop': 3})
+
+    out = DataFrameInjector({"A": shared, "B": shared, "C": shared}).inject_faults(df)
+
+    for col in df.columns:
+        np.testing.assert_array_equal(out[col].values, shared.inject_fault(df[col].values))
+    assert out["C"].dtype == df["C"].dtype
+
+@pytest.mark.parametrize("fault", [RampFault(), RampDriftFault()])
+def test_shared_injector_with_1d_fault_subclass_on_square_df(fault):
+    df = pd.DataFrame({
+        "a": [1.0, 2.0, 3.0],
+        "b": [10.0, 20.0, 30.0],
+        "c": [100.0, 200.0, 300.0],
+    })
+    shared = Injector(fault=fault, params={'start': 0, 'stop': 3})
+
+    out = DataFrameInjector({"a": shared, "b": shared, "c": shared}).inject_faults(df)
+
+    for col in df.columns:
+        np.testing.assert_array_equal(out[col].values, df[col].values + [0, 1, 2])
+
+def test_threaded_injection_matches_serial():
+    df = pd.DataFrame({
+        "A": [1.0, 2.0, 3.0, 4.0],
+        "B": [10, 20, 30, 40],
+        "C": [5.0, 6.0, 7.0, 8.0],
+    })
+    injector_dict = {
+        "A": Injector(fault=DriftFault(params={'drift_rate': 2})),
+        "B": AddOneFault(),
+        "C": Injector(fault=DriftFault(params={'drift_rate': -1}), params={'start': 1, 'stop': 3}),
+    }
+
+    serial = DataFrameInjector(injector_dict).inject_faults(df)
+    threaded = DataFrameInjector(injector_dict, max_workers=3).inject_faults(df)
+
+    pd.testing.assert_frame_equal(threaded, serial)
+
+
+@pytest.mark.parametrize("bad_value", [0, -1, 1.5, "2"])
+def test_invalid_max_workers_raises(bad_value):
+    with pytest.raises(ValueError, match="max_workers"):
+        DataFrameInjector(injector_dict={"A": DummyFault()}, max_workers=bad_value)
+
 # DataFrame validation tests
 def test_missing_column_raises():
     df = pd.DataFrame({"A": [1, 2, 3]})
@@ -107,6 +173,29 @@ def test_non_numeric_column_raises():
         inj.inject_faults(df)
 
 
+def test_timedelta_column_raises():
+    df = pd.DataFrame({"A": pd.to_timedelta([1, 2, 3], unit="s")})
+
+    inj = DataFrameInjector(
+        injector_dict={"A": Injector(fault=DriftFault())}
+    )
+
+    with pytest.raises(ValueError, match=r"df\['A'\]: \n must contain numeric values"):
+        inj.inject_faults(df)
+
+
+@pytest.mark.parametrize("dtype", ["Int64", "Float64"])
+def test_nullable_extension_column_raises(dtype):
+    df = pd.DataFrame({"A": pd.array([1, None, 3], dtype=dtype)})
+
+    inj = DataFrameInjector(
+        injector_dict={"A": DummyFault()}
+    )
+
+    with pytest.raises(ValueError, match="NumPy dtype"):
+        inj.inject_faults(df)
+
+
 def test_non_ndarray_values_raises():
     # Force object dtype that becomes non-numeric ndarray
     df = pd.DataFrame({
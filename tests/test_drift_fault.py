@@ -83,3 +83,72 @@ def test_negative_drift_rate():
     drift = np.array([-1, -2, -3])
     expected = x + drift
     np.testing.assert_array_equal(f(x), expected)
+
+
+def test_drift_2d_is_column_wise():
+    f = DriftFault(params={'drift_rate': 2})
+    x = np.zeros((3, 2))
+    expected = np.array([[2, 2], [4, 4], [6, 6]])
+    np.testing.assert_array_equal(f(x), expected)
+
+
+def test_drift_repeated_calls_with_new_length():
+    f = DriftFault(params={'drift_rate': 1})
+    np.testing.assert_array_equal(f(np.zeros(3)), [1, 2, 3])
+    np.testing.assert_array_equal(f(np.zeros(3)), [1, 2, 3])
+    np.testing.assert_array_equal(f(np.zeros(2)), [1, 2])
+
+
+def test_drift_rate_change_updates_cached_drift():
+    f = DriftFault(params={'drift_rate': 1})
+    x = np.zeros(3)
+    np.testing.assert_array_equal(f(x), [1, 2, 3])
+    f.drift_rate = 2
+    np.testing.assert_array_equal(f(x), [2, 4, 6])
+    f.drift_rate = 2.0
+    assert f(np.arange(3)).dtype == np.float64
+
+
+def test_drift_output_is_not_the_cached_drift():
+    f = DriftFault(params={'drift_rate': 1})
+    out = f(np.zeros(3))
+    out[:] = 0
+    np.testing.assert_array_equal(f(np.zeros(3)), [1, 2, 3])
+
+
+@pytest.mark.parametrize("x, drift_rate", [
+    (np.array([1, 2, 3]), 2),
+    (np.array([1, 2, 3]), 0.5),
+    (np.array([1.5, 2.5, 3.5]), 2),
+    (np.array([1.5, 2.5, 3.5], dtype=np.float32), 0.5),
+])
+def test_drift_dtype_matches_plain_addition(x, drift_rate):
+    f = DriftFault(params={'drift_rate': drift_rate})
+    expected = x + np.arange(1, len(x) + 1) * drift_rate
+    out = f(x)
+    assert out.dtype == expected.dtype
+    np.testing.assert_array_equal(out, expected)
+
+
+# Parameter assignment tests
+def test_valid_drift_rate_assignment():
+    f = DriftFault()
+    f.drift_rate = 3
+    assert f.drift_rate == 3
+
+
+def test_invalid_drift_rate_assignment_raises_on_call():
+    f = DriftFault()
+    f.drift_rate = "string"
+    with pytest.raises(ValueError, match="drift_rate"):
+        f(np.zeros(3))
+
+    f.drift_rate = 2
+    np.testing.assert_array_equal(f(np.zeros(3)), [2, 4, 6])
+
+
+def test_drift_batch_restarts_each_window():
+    f = DriftFault(params={'drift_rate': 1})
+    out = f.batch([np.zeros(3), np.zeros(2)])
+    np.testing.assert_array_equal(out[0], [1, 2, 3])
+    np.testing.assert_array_equal(out[1], [1, 2])
@@ -1,5 +1,7 @@
 import numpy as np
 import pytest
+from fault_injector.fault_lib import DriftFault, NaNFault, StuckValueFault
+from fault_injector.fault_lib.base_fault import BaseFault
 from fault_injector.injector import Injector
 
 # Dummy fault classes for testing
@@ -15,6 +17,50 @@ class AddOneFault:
         return x + 1
 
 
+class CountingFault:
+    """Counts how often it is called"""
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return x + 1
+
+
+class SpyNaNFault(NaNFault):
+    """Records the materialize argument it is called with"""
+    _broadcast_view = True
+
+    def __call__(self, x, materialize=True):
+        self.materialize = materialize
+        return super().__call__(x, materialize=materialize)
+
+
+class InplaceAddFault:
+    """Modifies its input in place and returns it"""
+    def __call__(self, x):
+        x += 100
+        return x
+
+
+class RampFault(BaseFault):
+    """BaseFault subclass written for 1-D input"""
+    def __call__(self, x):
+        return x + np.arange(len(x))
+
+
+class RecordingFault:
+    """Records the array it is called with"""
+    def __call__(self, x):
+        self.arg = x
+        return x + 1
+
+
+class RecordingPreservingFault(RecordingFault):
+    """RecordingFault that declares it never modifies its input"""
+    _preserves_input = True
+
+
 class BadFaultClass:
     """Used to test passing a class instead of an instance"""
     def __call__(self, x):
@@ -70,6 +116,16 @@ def test_invalid_stop_type_raises(bad_value):
             params={"start": 0, "stop": bad_value}
         )
 
+@pytest.mark.parametrize("int_type", [np.int8, np.int16, np.int32, np.int64, np.uint16, np.uint32])
+def test_numpy_integer_params_accepted(int_type):
+    inj = Injector(
+        fault=AddOneFault(),
+        params={"start": int_type(1), "stop": int_type(3)}
+    )
+    assert type(inj.start) is int and type(inj.stop) is int
+    out = inj.inject_fault(np.array([10, 20, 30, 40]))
+    np.testing.assert_array_equal(out, [10, 21, 31, 40])
+
 # Data type validation tests
 @pytest.mark.parametrize("bad_x", [
     None,
@@ -188,9 +244,206 @@ def test_original_input_not_modified():
     np.testing.assert_array_equal(x, [1, 2, 3])
 
 # Fault instance validation
+def test_inplace_modifying_fault_does_not_change_input():
+    inj = Injector(fault=InplaceAddFault(), params={"start": 1, "stop": 3})
+    x = np.array([10, 20, 30, 40])
+
+    np.testing.assert_array_equal(inj.inject_fault(x), [10, 120, 130, 40])
+    np.testing.assert_array_equal(inj.inject_fault_into(np.empty_like(x), x), [10, 120, 130, 40])
+    np.testing.assert_array_equal(x, [10, 20, 30, 40])
+
+    X = np.arange(8).reshape(2, 4)
+    np.testing.assert_array_equal(inj.inject_fault_batch(X), [[0, 101, 102, 3], [4, 105, 106, 7]])
+    np.testing.assert_array_equal(X, np.arange(8).reshape(2, 4))
+
+
+def test_only_input_preserving_faults_get_a_view_of_x():
+    x = np.array([10, 20, 30, 40])
+
+    preserving = RecordingPreservingFault()
+    out = Injector(fault=preserving, params={"start": 1, "stop": 3}).inject_fault(x)
+    assert np.shares_memory(preserving.arg, x)
+    np.testing.assert_array_equal(out, [10, 21, 31, 40])
+
+    other = RecordingFault()
+    out = Injector(fault=other, params={"start": 1, "stop": 3}).inject_fault(x)
+    assert not np.shares_memory(other.arg, x)
+    np.testing.assert_array_equal(out, [10, 21, 31, 40])
+
+
 def test_fault_class_is_accepted_by_default():
     inj = Injector(fault=BadFaultClass)
     x = np.array([1, 2, 3])
 
     with pytest.raises(TypeError):
         inj.inject_fault(x)
+
+
+# In-place injection tests
+def test_inplace_injection_modifies_input():
+    inj = Injector(fault=AddOneFault(), params={"start": 1, "stop": 3})
+    x = np.array([10, 20, 30, 40])
+
+    out = inj.inject_fault(x, inplace=True)
+
+    assert out is x
+    np.testing.assert_array_equal(x, [10, 21, 31, 40])
+
+
+def test_inplace_injection_with_list_returns_new_array():
+    inj = Injector(fault=AddOneFault(), params={"start": 0, "stop": 2})
+    x = [1, 2, 3]
+
+    out = inj.inject_fault(x, inplace=True)
+
+    np.testing.assert_array_equal(out, [2, 3, 3])
+    assert x == [1, 2, 3]
+
+
+# Repeated injection tests
+def test_repeated_injection_rechecks_changed_params():
+    inj = Injector(fault=AddOneFault(), params={"start": 0, "stop": 2})
+    x = np.array([1, 2, 3])
+    np.testing.assert_array_equal(inj.inject_fault(x), [2, 3, 3])
+
+    inj.stop = 10
+    with pytest.raises(ValueError, match="stop"):
+        inj.inject_fault(x)
+
+
+def test_reassigned_numpy_integer_params_are_stored_as_int():
+    inj = Injector(fault=AddOneFault(), params={"start": 0, "stop": 2})
+    x = np.array([1, 2, 3, 4])
+
+    inj.start = np.int64(1)
+    inj.stop = np.uint8(3)
+    np.testing.assert_array_equal(inj.inject_fault(x), [1, 3, 4, 4])
+    assert type(inj.start) is int and type(inj.stop) is int
+
+
+@pytest.mark.parametrize("param", ["start", "stop"])
+def test_repeated_injection_rechecks_equal_float_params(param):
+    inj = Injector(fault=AddOneFault(), params={"start": 1, "stop": 3})
+    x = np.array([1, 2, 3, 4])
+    inj.inject_fault(x)
+
+    setattr(inj, param, float(getattr(inj, param)))
+    with pytest.raises(ValueError, match=param):
+        inj.inject_fault(x)
+
+
+def test_repeated_injection_rechecks_new_length():
+    inj = Injector(fault=AddOneFault(), params={"start": 2, "stop": 3})
+    np.testing.assert_array_equal(inj.inject_fault(np.array([1, 2, 3])), [1, 2, 4])
+
+    with pytest.raises(ValueError, match="start"):
+        inj.inject_fault(np.array([1, 2]))
+
+
+# Batch injection tests
+def test_batch_injection_matches_per_row_injection():
+    inj = Injector(fault=DriftFault(params={'drift_rate': 2}), params={"start": 1, "stop": 4})
+    X = np.arange(15, dtype=float).reshape(3, 5)
+
+    out = inj.inject_fault_batch(X)
+
+    assert out.shape == X.shape
+    for row_out, row in zip(out, X):
+        np.testing.assert_array_equal(row_out, inj.inject_fault(row))
+    np.testing.assert_array_equal(X, np.arange(15, dtype=float).reshape(3, 5))
+
+
+@pytest.mark.parametrize("shape", [(3, 3), (2, 4)])
+def test_batch_injection_with_1d_fault_is_row_wise(shape):
+    inj = Injector(fault=RampFault(), params={"start": 0, "stop": shape[1]})
+    X = np.zeros(shape)
+
+    out = inj.inject_fault_batch(X)
+
+    np.testing.assert_array_equal(out, [np.arange(shape[1])] * shape[0])
+    np.testing.assert_array_equal(X, np.zeros(shape))
+
+
+def test_batch_injection_requires_2d():
+    inj = Injector(fault=IdentityFault())
+    with pytest.raises(ValueError, match="2-D"):
+        inj.inject_fault_batch(np.array([1, 2, 3]))
+
+
+@pytest.mark.parametrize("start, stop", [(0, -1), (1, 3), (-3, -1), (2, 2), (3, 1), (0, 4)])
+def test_injection_matches_full_copy(start, stop):
+    inj = Injector(fault=AddOneFault(), params={"start": start, "stop": stop})
+    x = np.array([10, 20, 30, 40])
+
+    expected = x.copy()
+    expected[start:stop] = expected[start:stop] + 1
+
+    np.testing.assert_array_equal(inj.inject_fault(x), expected)
+    np.testing.assert_array_equal(x, [10, 20, 30, 40])
+
+
+# Injection into a caller-supplied buffer tests
+def test_inject_fault_into_reuses_buffer():
+    inj = Injector(fault=AddOneFault(), params={"start": 1, "stop": 3})
+    out = np.empty(4, dtype=int)
+
+    for x in (np.array([10, 20, 30, 40]), np.array([1, 2, 3, 4])):
+        result = inj.inject_fault_into(out, x)
+        assert result is out
+        np.testing.assert_array_equal(out, inj.inject_fault(x))
+
+    np.testing.assert_array_equal(out, [1, 3, 4, 4])
+
+
+@pytest.mark.parametrize("bad_out", [[0, 0, 0, 0], np.empty(3), np.empty((4, 1)), np.empty(4, dtype=np.float32)])
+def test_inject_fault_into_invalid_out_raises(bad_out):
+    inj = Injector(fault=IdentityFault())
+    with pytest.raises(ValueError, match="out"):
+        inj.inject_fault_into(bad_out, np.array([1, 2, 3, 4]))
+
+
+# Empty window tests
+@pytest.mark.parametrize("start, stop", [(2, 2), (3, 1), (-1, 2)])
+def test_empty_window_skips_fault(start, stop):
+    fault = CountingFault()
+    inj = Injector(fault=fault, params={"start": start, "stop": stop})
+    x = np.array([10, 20, 30, 40])
+
+    out = inj.inject_fault(x)
+    assert out is not x
+    np.testing.assert_array_equal(out, x)
+
+    assert inj.inject_fault(x, inplace=True) is x
+    np.testing.assert_array_equal(inj.inject_fault_into(np.empty_like(x), x), x)
+    assert fault.calls == 0
+
+
+# Broadcast view tests
+def test_broadcast_view_fault_is_called_without_materializing():
+    fault = SpyNaNFault()
+    inj = Injector(fault=fault, params={"start": 1, "stop": 3})
+    x = np.array([1.0, 2.0, 3.0, 4.0])
+
+    out = inj.inject_fault(x)
+
+    assert fault.materialize is False
+    np.testing.assert_array_equal(out, [1.0, np.nan, np.nan, 4.0])
+    assert out.flags.writeable
+
+
+def test_fault_subclass_without_broadcast_view_is_called_plainly():
+    class PlainNaNFault(NaNFault):
+        def __call__(self, x):
+            return super().__call__(x)
+
+    inj = Injector(fault=PlainNaNFault(), params={"start": 1, "stop": 3})
+    np.testing.assert_array_equal(inj.inject_fault(np.zeros(4)), [0.0, np.nan, np.nan, 0.0])
+
+
+def test_stuck_value_fault_injection_is_writeable():
+    inj = Injector(fault=StuckValueFault(params={'stuck_val': 7}), params={"start": 1, "stop": 3})
+
+    out = inj.inject_fault(np.array([1, 2, 3, 4]))
+
+    np.testing.assert_array_equal(out, [1, 7, 7, 4])
+    out[1] = 0
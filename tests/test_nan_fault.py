@@ -23,6 +23,13 @@ def test_non_numeric_array_raises():
         f(x)
 
 
+def test_numeric_array_passes():
+    f = NaNFault()
+    x = np.array([1, 2, 3])
+    out = f(x)
+    assert isinstance(out, np.ndarray)
+
+
 # nan behavior tests
 def test_nan_output():
     f = NaNFault()
@@ -35,4 +42,24 @@ def test_nan_list_value():
     f = NaNFault()
     x = [5, 5, 5, 5]
     expected = np.array([np.nan, np.nan, np.nan, np.nan])
-    np.testing.assert_array_equal(f(x), expected)
\ No newline at end of file
+    np.testing.assert_array_equal(f(x), expected)
+
+def test_nan_view_is_read_only():
+    f = NaNFault()
+    out = f(np.zeros((4, 2)), materialize=False)
+    assert out.shape == (4, 2)
+    assert not out.flags.writeable
+    assert np.isnan(out).all()
+
+
+@pytest.mark.parametrize("dtype, expected", [
+    (np.float16, np.float16),
+    (np.float32, np.float32),
+    (np.float64, np.float64),
+    (np.int32, np.float64),
+])
+@pytest.mark.parametrize("materialize", [True, False])
+def test_nan_dtype_follows_float_input(dtype, expected, materialize):
+    f = NaNFault()
+    out = f(np.zeros(3, dtype=dtype), materialize=materialize)
+    assert out.dtype == expected
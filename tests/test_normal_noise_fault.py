@@ -87,3 +87,76 @@ def test_numeric_array_passes():
     out = f(x)
     assert isinstance(out, np.ndarray)
 
+
+# Parameter assignment tests
+def test_valid_sigma_assignment():
+    f = NormalNoiseFault()
+    f.sigma = 3
+    assert f.sigma == 3
+
+
+def test_invalid_sigma_assignment_raises_on_call():
+    f = NormalNoiseFault()
+    f.sigma = "string"
+    with pytest.raises(ValueError, match="sigma"):
+        f(np.zeros(3))
+
+
+def test_negative_sigma_assignment_raises_on_call():
+    f = NormalNoiseFault()
+    f.sigma = -1
+    with pytest.raises(ValueError, match="sigma"):
+        f(np.zeros(3))
+
+    f.sigma = 1
+    f(np.zeros(3))
+
+
+def test_complex_sigma_assignment_raises_on_call():
+    f = NormalNoiseFault()
+    f.sigma = 1j
+    with pytest.raises(TypeError):
+        f(np.zeros(3))
+
+
+# Seed tests
+def test_same_seed_gives_same_noise():
+    x = np.zeros(50)
+    np.testing.assert_array_equal(NormalNoiseFault(seed=7)(x), NormalNoiseFault(seed=7)(x))
+
+
+def test_different_seed_gives_different_noise():
+    x = np.zeros(50)
+    assert not np.array_equal(NormalNoiseFault(seed=7)(x), NormalNoiseFault(seed=8)(x))
+
+
+# dtype tests
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_float_input_dtype_is_kept(dtype):
+    f = NormalNoiseFault(params={'mu': 1, 'sigma': 0.5})
+    out = f(np.zeros(10, dtype=dtype))
+    assert out.dtype == dtype
+
+
+@pytest.mark.parametrize("mu, sigma", [(2, 1), (0.5, 0.5), (np.float64(1), np.float64(2)), (np.int64(2), np.int64(1))])
+def test_numpy_params_keep_float32_precision(mu, sigma):
+    f = NormalNoiseFault(params={'mu': mu, 'sigma': sigma}, seed=0)
+    out = f(np.zeros(10, dtype=np.float32))
+    assert out.dtype == np.float32
+
+
+def test_zero_sigma_gives_constant_offset():
+    f = NormalNoiseFault(params={'mu': 3, 'sigma': 0})
+    np.testing.assert_array_equal(f(np.zeros(5, dtype=np.float32)), np.full(5, 3))
+
+
+def test_int_input_gives_float_output():
+    f = NormalNoiseFault(params={'mu': 0, 'sigma': 0})
+    out = f(np.arange(5))
+    assert out.dtype == np.float64
+    np.testing.assert_array_equal(out, np.arange(5))
+
+
+def test_complex_mu_widens_output():
+    f = NormalNoiseFault(params={'mu': 1j, 'sigma': 0})
+    np.testing.assert_array_equal(f(np.zeros(3)), np.full(3, 1j))
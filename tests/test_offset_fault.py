@@ -89,3 +89,42 @@ def test_negative_offset_by():
     offset = np.array([-1, -1, -1])
     expected = x + offset
     np.testing.assert_array_equal(f(x), expected)
+
+
+def test_offset_inplace_writes_into_input():
+    f = OffsetFault(params={'offset_by': 2})
+    x = np.array([1.0, 2.0, 3.0])
+    out = f(x, inplace=True)
+    assert out is x
+    np.testing.assert_array_equal(x, [3.0, 4.0, 5.0])
+
+
+def test_offset_inplace_falls_back_when_dtype_changes():
+    f = OffsetFault(params={'offset_by': 0.5})
+    x = np.array([1, 2, 3])
+    out = f(x, inplace=True)
+    np.testing.assert_array_equal(out, [1.5, 2.5, 3.5])
+    np.testing.assert_array_equal(x, [1, 2, 3])
+
+
+# Parameter assignment tests
+def test_valid_offset_by_assignment():
+    f = OffsetFault()
+    f.offset_by = 3
+    assert f.offset_by == 3
+
+
+def test_invalid_offset_by_assignment_raises_on_call():
+    f = OffsetFault()
+    f.offset_by = "string"
+    with pytest.raises(ValueError, match="offset_by"):
+        f(np.zeros(3))
+
+
+@pytest.mark.parametrize("offset_by", [2, 0.5, np.float64(0.5), np.int64(2)])
+def test_offset_keeps_float32_precision(offset_by):
+    f = OffsetFault(params={'offset_by': offset_by})
+    x = np.array([1.0, 2.0], dtype=np.float32)
+    out = f(x)
+    assert out.dtype == np.float32
+    np.testing.assert_array_equal(out, x + np.float32(offset_by))
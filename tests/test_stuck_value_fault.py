@@ -89,3 +89,32 @@ def test_negative_stuck_val():
     x = np.array([1, 2, 3])
     expected = np.array([-1, -1, -1])
     np.testing.assert_array_equal(f(x), expected)
+
+
+# Parameter assignment tests
+def test_valid_stuck_val_assignment():
+    f = StuckValueFault()
+    f.stuck_val = 3
+    assert f.stuck_val == 3
+
+
+def test_invalid_stuck_val_assignment_raises_on_call():
+    f = StuckValueFault()
+    f.stuck_val = "string"
+    with pytest.raises(ValueError, match="stuck_val"):
+        f(np.zeros(3))
+
+
+@pytest.mark.parametrize("stuck_val", [2, 2.5, np.float32(1.5), np.int32(3)])
+def test_stuck_value_dtype_follows_stuck_val(stuck_val):
+    f = StuckValueFault(params={'stuck_val': stuck_val})
+    out = f(np.zeros(4))
+    assert out.dtype == np.asarray(stuck_val).dtype
+    np.testing.assert_array_equal(out, np.full(4, stuck_val))
+
+
+def test_stuck_value_view_is_read_only():
+    f = StuckValueFault(params={'stuck_val': 4})
+    out = f(np.zeros(5), materialize=False)
+    assert not out.flags.writeable
+    np.testing.assert_array_equal(out, f(np.zeros(5)))
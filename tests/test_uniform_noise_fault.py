@@ -91,4 +91,90 @@ def test_numeric_list_passes():
     f = UniformNoiseFault()
     x = [1, 2, 3]
     out = f(x)
-    assert isinstance(out, np.ndarray)
\ No newline at end of file
+    assert isinstance(out, np.ndarray)
+
+
+# Parameter assignment tests
+def test_valid_max_val_assignment():
+    f = UniformNoiseFault()
+    f.max_val = 3
+    assert f.max_val == 3
+
+
+def test_invalid_max_val_assignment_raises_on_call():
+    f = UniformNoiseFault()
+    f.max_val = "string"
+    with pytest.raises(ValueError, match="max_val"):
+        f(np.zeros(3))
+
+
+def test_max_val_below_min_val_assignment_raises_on_call():
+    f = UniformNoiseFault()
+    f.max_val = -1
+    with pytest.raises(ValueError, match="max_val"):
+        f(np.zeros(3))
+
+
+def test_bounds_assigned_one_at_a_time():
+    f = UniformNoiseFault(seed=0)
+    f.min_val = 5
+    f.max_val = 10
+    out = f(np.zeros(100))
+    assert out.min() >= 5 and out.max() <= 10
+
+
+def test_set_range_moves_both_bounds():
+    f = UniformNoiseFault(seed=0)
+    f.set_range(5, 10)
+    assert (f.min_val, f.max_val) == (5, 10)
+    out = f(np.zeros(100))
+    assert out.min() >= 5 and out.max() <= 10
+
+
+def test_invalid_set_range_raises_and_keeps_values():
+    f = UniformNoiseFault()
+    with pytest.raises(ValueError, match="max_val"):
+        f.set_range(10, 5)
+    assert (f.min_val, f.max_val) == (0, 1)
+
+
+def test_complex_max_val_assignment_raises_on_call():
+    f = UniformNoiseFault()
+    f.max_val = 1j
+    with pytest.raises(TypeError):
+        f(np.zeros(3))
+
+
+# Seed tests
+def test_same_seed_gives_same_noise():
+    x = np.zeros(50)
+    np.testing.assert_array_equal(UniformNoiseFault(seed=7)(x), UniformNoiseFault(seed=7)(x))
+
+
+def test_different_seed_gives_different_noise():
+    x = np.zeros(50)
+    assert not np.array_equal(UniformNoiseFault(seed=7)(x), UniformNoiseFault(seed=8)(x))
+
+
+# dtype tests
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_float_input_dtype_is_kept(dtype):
+    f = UniformNoiseFault(params={'min_val': 2, 'max_val': 5})
+    out = f(np.zeros(1000, dtype=dtype))
+    assert out.dtype == dtype
+    assert out.min() >= 2 and out.max() <= 5
+
+
+def test_int_input_gives_float_output():
+    f = UniformNoiseFault(params={'min_val': 1, 'max_val': 2})
+    out = f(np.zeros(100, dtype=int))
+    assert out.dtype == np.float64
+    assert out.min() >= 1 and out.max() <= 2
+
+
+@pytest.mark.parametrize("min_val, max_val", [(2, 5), (0.5, 1.5), (np.float64(1), np.float64(2)), (np.int64(1), np.int64(3))])
+def test_numpy_params_keep_float32_precision(min_val, max_val):
+    f = UniformNoiseFault(params={'min_val': min_val, 'max_val': max_val}, seed=0)
+    out = f(np.zeros(10, dtype=np.float32))
+    assert out.dtype == np.float32
+    assert out.min() >= min_val and out.max() <= max_val